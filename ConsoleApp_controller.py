@@ -4,14 +4,60 @@ import ttkbootstrap as bs
 import subprocess
 import pandas as pd
 import os
+import sys
+import shutil
+import io
+import ctypes
 import threading
 import queue
+import asyncio
+from collections import OrderedDict
+
+# pyarrow is optional; when present pandas can parse the results CSV on all cores
+# and a Parquet copy of the results is kept next to the CSV for fast reloads
+try:
+    import pyarrow  # noqa: F401
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+CSV_ENGINE = "pyarrow" if HAVE_PYARROW else "c"
+
+# Simulation parameters as (argument name, label, default, type). The type is checked
+# before the executable is launched; the C++ side reads each one as "--name value".
+_PARAMETERS = (
+    ("width", "Grid Width", "100", int), ("length", "Grid Length", "100", int),
+    ("ants", "Number of Ants", "500", int), ("experiments", "Number of Experiments", "5", int),
+    ("iterations", "Iterations per Exp.", "50001", int), ("memory_size", "Ant Memory Size", "20", int),
+    ("threshold_start", "Threshold Start", "0", int), ("threshold_end", "Threshold End", "20", int),
+    ("threshold_interval", "Threshold Interval", "5", int),
+    ("cooldown_start", "Cooldown Start", "0", int), ("cooldown_end", "Cooldown End", "20", int),
+    ("cooldown_interval", "Cooldown Interval", "5", int),
+    ("prob_relu_low", "Prob. ReLU Low", "0.3", float), ("prob_relu_high", "Prob. ReLU High", "0.7", float),
+)
 
 class SimulationLauncherApp(bs.Window):
     """
     A GUI application to launch a C++ ant simulation, configure its parameters,
     and display the resulting data from the output CSV file.
     """
+    # Column types of the CSV written by the C++ core (see write_csv_header)
+    CSV_DTYPES = {
+        "Cooldown": "int32", "Threshold": "int32", "Run": "int32", "Iteration": "int32",
+        "ClusterSize": "float64", "InteractionCount": "int64",
+    }
+    # Rows parsed per chunk when streaming a results CSV into the table
+    CSV_CHUNK_SIZE = 50_000
+    # Result files larger than this are only parsed from their last CSV_TAIL_BYTES
+    CSV_TAIL_BYTES = 16 << 20
+    # Rendered row tuples kept around so scrolling back is a dictionary hit
+    ROW_CACHE_SIZE = 2048
+    # Bytes requested per read from the simulation's stdout pipe
+    STDOUT_READ_SIZE = 1 << 16
+    # Seconds the asyncio loop runs per 10 ms Tk tick while a simulation is running
+    EVENT_LOOP_SLICE = 0.005
+    # Scrollback kept in the console; older lines are dropped from the top
+    CONSOLE_MAX_LINES = 5000
+
     def __init__(self):
         super().__init__(themename="litera") # You can try other themes like 'superhero', 'darkly', 'litera'
         self.title("Ant Simulation Launcher")
@@ -21,15 +67,34 @@ class SimulationLauncherApp(bs.Window):
         self.executable_path = tk.StringVar(value=r"D:\New_folder\CPP_Project\test-ant\x64\Release\ConsoleApp_ffmpeg.exe")
         self.output_csv_path = tk.StringVar(value="ground_data.csv")
         self.param_entries = {}
+
+        # The results table only materializes the rows inside its viewport;
+        # the parsed CSV chunks are the data model behind it.
+        self._result_chunks = []
+        self._result_row_count = 0
+        self._first_visible_row = 0
+        self._row_cache = OrderedDict()
+        # Column layout currently applied to the results table
+        self._cached_cols = None
+        # Prefixed to the status of the current load, so it isn't overwritten
+        self._load_status_note = ""
+        # Bumped per load; messages from a superseded loader thread are dropped
+        self._load_generation = 0
         
-        # Queue for thread-safe communication with the GUI
-        self.log_queue = queue.Queue()
+        # Queue for handing parsed CSV chunks from the loader thread to the GUI
+        self.results_queue = queue.Queue()
+
+        # The simulation subprocess is driven by an asyncio loop on the Tk thread,
+        # pumped from the mainloop only while a run is in progress
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._sim_task = None
 
         # --- UI Setup ---
         self.setup_ui()
         
-        # Start the queue processor
-        self.process_log_queue()
+        # The loader thread wakes the GUI with a virtual event instead of it polling the queue
+        self.bind("<<ResultsUpdate>>", self.drain_results_queue)
 
     def setup_ui(self):
         """Creates and arranges all the widgets in the main window."""
@@ -73,31 +138,18 @@ class SimulationLauncherApp(bs.Window):
         params_frame = bs.Labelframe(parent_frame, text="Simulation Parameters", padding=10)
         params_frame.pack(fill=tk.BOTH, expand=True)
 
-        parameters = {
-            "width": ("Grid Width", "100"), "length": ("Grid Length", "100"),
-            "ants": ("Number of Ants", "500"), "experiments": ("Number of Experiments", "5"),
-            "iterations": ("Iterations per Exp.", "50001"), "memory_size": ("Ant Memory Size", "20"),
-            "threshold_start": ("Threshold Start", "0"), "threshold_end": ("Threshold End", "20"),
-            "threshold_interval": ("Threshold Interval", "5"), 
-            # --- NEW: Added cooldown parameters to the GUI ---
-            "cooldown_start": ("Cooldown Start", "0"), "cooldown_end": ("Cooldown End", "20"),
-            "cooldown_interval": ("Cooldown Interval", "5"),
-            "prob_relu_low": ("Prob. ReLU Low", "0.3"), "prob_relu_high": ("Prob. ReLU High", "0.7"),
-        }
-
-        row_num = 0
-        for name, (label, default) in parameters.items():
-            ttk.Label(params_frame, text=label).grid(row=row_num, column=0, padx=5, pady=5, sticky="w")
-            entry = ttk.Entry(params_frame, width=15); entry.insert(0, default)
+        Label, Entry = ttk.Label, ttk.Entry
+        for row_num, (name, label, default, cast) in enumerate(_PARAMETERS):
+            Label(params_frame, text=label).grid(row=row_num, column=0, padx=5, pady=5, sticky="w")
+            entry = Entry(params_frame, width=15); entry.insert(0, default)
             entry.grid(row=row_num, column=1, padx=5, pady=5, sticky="ew")
-            self.param_entries[name] = entry
-            row_num += 1
+            self.param_entries[name] = (entry, cast)
         params_frame.columnconfigure(1, weight=1)
 
         button_frame = bs.Frame(parent_frame)
         button_frame.pack(fill=tk.X, pady=(10, 0))
 
-        self.run_button = bs.Button(button_frame, text="Run Simulation", command=self.start_simulation_thread, bootstyle="success")
+        self.run_button = bs.Button(button_frame, text="Run Simulation", command=self.start_simulation, bootstyle="success")
         self.run_button.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
 
         self.load_button = bs.Button(button_frame, text="Load Results from CSV", command=self.load_results_from_csv, bootstyle="info-outline")
@@ -114,12 +166,121 @@ class SimulationLauncherApp(bs.Window):
         tree_container.pack(fill=tk.BOTH, expand=True, pady=5)
         self.results_tree = ttk.Treeview(tree_container, show="headings", bootstyle="primary")
         
-        vsb = ttk.Scrollbar(tree_container, orient="vertical", command=self.results_tree.yview)
-        hsb = ttk.Scrollbar(tree_container, orient="horizontal", command=self.results_tree.xview)
-        self.results_tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
-        vsb.pack(side='right', fill='y'); hsb.pack(side='bottom', fill='x')
+        # The vertical scrollbar tracks the whole dataset rather than the tree's items
+        self.results_vsb = ttk.Scrollbar(tree_container, orient="vertical", command=self.on_results_scroll)
+        self.results_hsb = ttk.Scrollbar(tree_container, orient="horizontal", command=self.results_tree.xview)
+        self.results_tree.configure(xscrollcommand=self.results_hsb.set)
+        self.results_vsb.pack(side='right', fill='y'); self.results_hsb.pack(side='bottom', fill='x')
         self.results_tree.pack(fill=tk.BOTH, expand=True)
 
+        # Row geometry used to size the viewport. Start from the tree's own (bootstyle) style;
+        # refresh_results_viewport replaces it with the measured bbox of a rendered row.
+        style = self.results_tree.cget("style") or "Treeview"
+        self._row_height = int(float(ttk.Style().lookup(style, "rowheight") or 20))
+        self._rows_top = self._row_height # Headings are assumed one row tall until measured
+
+        self.results_tree.bind("<Configure>", lambda e: self.refresh_results_viewport())
+        self.results_tree.bind("<MouseWheel>", self.on_results_mousewheel)
+        self.results_tree.bind("<Button-4>", self.on_results_mousewheel)
+        self.results_tree.bind("<Button-5>", self.on_results_mousewheel)
+        for key in ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            self.results_tree.bind(key, self.on_results_key)
+
+    def visible_result_rows(self):
+        """Returns how many table rows fit in the results viewport."""
+        return max(1, (self.results_tree.winfo_height() - self._rows_top) // self._row_height)
+
+    def result_row_values(self, index):
+        """Returns the display tuple for a dataset row, rendering it on a cache miss."""
+        values = self._row_cache.get(index)
+        if values is not None:
+            self._row_cache.move_to_end(index)
+            return values
+        chunk = self._result_chunks[index // self.CSV_CHUNK_SIZE]
+        row = index % self.CSV_CHUNK_SIZE
+        values = tuple(str(chunk.iat[row, col]) for col in range(chunk.shape[1]))
+        self._row_cache[index] = values
+        if len(self._row_cache) > self.ROW_CACHE_SIZE:
+            self._row_cache.popitem(last=False)
+        return values
+
+    def refresh_results_viewport(self):
+        """Re-populates the table with only the rows currently in view."""
+        visible = self.visible_result_rows()
+        first = max(0, min(self._first_visible_row, self._result_row_count - visible))
+        last = min(first + visible, self._result_row_count)
+        self._first_visible_row = first
+
+        # Detach the horizontal scrollbar while rows are swapped so it isn't recomputed per insert
+        self.results_tree.configure(xscrollcommand="")
+        # Row iids are dataset indices, so the selection survives the rebuild for rows still in view
+        selected, focused = self.results_tree.selection(), self.results_tree.focus()
+        children = self.results_tree.get_children()
+        if children: self.results_tree.delete(*children)
+        insert = self.results_tree.insert
+        for index in range(first, last):
+            insert("", tk.END, iid=str(index), values=self.result_row_values(index))
+        kept = [iid for iid in selected if first <= int(iid) < last]
+        if kept: self.results_tree.selection_set(kept)
+        if focused and first <= int(focused) < last: self.results_tree.focus(focused)
+        self.results_tree.configure(xscrollcommand=self.results_hsb.set)
+
+        if self._result_row_count:
+            self.results_vsb.set(first / self._result_row_count, last / self._result_row_count)
+        else:
+            self.results_vsb.set(0, 1)
+        self.results_tree.update_idletasks() # Lay out and paint the new rows in one pass
+
+        # Measure where rows actually start and how tall they are (headings padding, font
+        # metrics, HiDPI scaling) and re-fit the viewport if the estimate was off
+        if first < last:
+            bbox = self.results_tree.bbox(str(first))
+            if bbox and bbox[3] > 0 and (bbox[1], bbox[3]) != (self._rows_top, self._row_height):
+                self._rows_top, self._row_height = bbox[1], bbox[3]
+                self.refresh_results_viewport()
+
+    def on_results_scroll(self, action, *args):
+        """Scrollbar command: moves the viewport over the dataset."""
+        if action == "moveto":
+            self._first_visible_row = int(float(args[0]) * self._result_row_count)
+        elif action == "scroll":
+            step = int(args[0])
+            if args[1] == "pages":
+                step *= self.visible_result_rows()
+            self._first_visible_row += step
+        self.refresh_results_viewport()
+
+    def on_results_mousewheel(self, event):
+        if event.num == 4: step = -3
+        elif event.num == 5: step = 3
+        elif event.delta: step = -3 if event.delta > 0 else 3 # Touchpads send deltas well under 120
+        else: return "break"
+        self.on_results_scroll("scroll", step, "units")
+        return "break" # Keep the tree from scrolling its own (viewport-only) items
+
+    def on_results_key(self, event):
+        """Navigation keys: moves the focused row over the whole dataset, scrolling the viewport with it."""
+        if not self._result_row_count:
+            return "break"
+        page = self.visible_result_rows()
+        focused = self.results_tree.focus()
+        current = int(focused) if focused else self._first_visible_row
+        if event.keysym == "Home": target = 0
+        elif event.keysym == "End": target = self._result_row_count - 1
+        else:
+            step = {"Up": -1, "Down": 1, "Prior": -page, "Next": page}[event.keysym]
+            target = max(0, min(current + step, self._result_row_count - 1))
+
+        # Scroll just far enough to bring the target row into view
+        if target < self._first_visible_row:
+            self.on_results_scroll("scroll", target - self._first_visible_row, "units")
+        elif target >= self._first_visible_row + page:
+            self.on_results_scroll("scroll", target - self._first_visible_row - page + 1, "units")
+        if self.results_tree.exists(str(target)):
+            self.results_tree.focus(str(target))
+            self.results_tree.selection_set(str(target))
+        return "break" # The tree's own bindings only know the materialized rows
+
     def create_console_output(self, parent_frame):
         """Creates the console output text area."""
         console_labelframe = bs.Labelframe(parent_frame, text="Console Output", padding=5)
@@ -129,81 +290,273 @@ class SimulationLauncherApp(bs.Window):
         self.console_output.pack(fill=tk.BOTH, expand=True)
         
     def log_message(self, message):
-        """Inserts a message into the console output widget."""
+        """Inserts a message into the console output widget, keeping only the last CONSOLE_MAX_LINES lines."""
         self.console_output.config(state='normal')
         self.console_output.insert(tk.END, message)
+        line_count = int(self.console_output.index('end-1c').split('.')[0])
+        if line_count > self.CONSOLE_MAX_LINES:
+            self.console_output.delete('1.0', f'{line_count - self.CONSOLE_MAX_LINES + 1}.0')
         self.console_output.see(tk.END) # Auto-scroll
         self.console_output.config(state='disabled')
 
-    def process_log_queue(self):
-        """Processes messages from the log queue to update the GUI."""
+    def post_results_message(self, generation, kind, payload):
+        """Queues a results message and wakes the GUI thread. Called from the loader thread."""
+        self.results_queue.put((generation, kind, payload))
+        try:
+            self.event_generate("<<ResultsUpdate>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            pass # Window is closing; nothing left to update
+
+    def drain_results_queue(self, event=None):
+        """Processes messages from the results queue to update the GUI."""
         try:
             while True:
-                message = self.log_queue.get_nowait()
-                self.log_message(message)
+                generation, kind, payload = self.results_queue.get_nowait()
+                if generation == self._load_generation:
+                    self.handle_results_message(kind, payload)
         except queue.Empty:
             pass # No more messages
-        self.after(100, self.process_log_queue) # Check again after 100ms
+
+    def poll_results_queue(self, load_thread):
+        """Safety net for a lost wakeup event: drains periodically until the load finishes."""
+        loading = load_thread.is_alive()
+        self.drain_results_queue()
+        if loading:
+            self.after(250, self.poll_results_queue, load_thread)
 
     def browse_for_exe(self):
         path = filedialog.askopenfilename(title="Select Executable", filetypes=(("Executable files", "*.exe"), ("All files", "*.*")))
         if path: self.executable_path.set(path)
             
-    def start_simulation_thread(self):
+    def start_simulation(self):
         self.run_button.config(state=tk.DISABLED)
         self.status_var.set("Running simulation... please wait.")
         self.console_output.config(state='normal')
         self.console_output.delete(1.0, tk.END)
         self.console_output.config(state='disabled')
-        
-        sim_thread = threading.Thread(target=self.run_simulation_logic, daemon=True)
-        sim_thread.start()
 
-    def run_simulation_logic(self):
+        self._sim_task = self._loop.create_task(self.run_simulation_async())
+        self.pump_event_loop()
+
+    def pump_event_loop(self):
+        """Runs the asyncio loop for a short slice, rescheduling while any of its tasks is unfinished."""
+        # Nothing reads the pipe between ticks, so a chatty simulation blocks once the OS pipe
+        # buffer is full. Running the loop for a slice (waiting in select, not spinning) lets it
+        # read and log output repeatedly within the tick instead of once per tick.
+        stop = self._loop.call_later(self.EVENT_LOOP_SLICE, self._loop.stop)
+        self._loop.run_forever()
+        stop.cancel()
+        if asyncio.all_tasks(self._loop):
+            self.after(10, self.pump_event_loop)
+
+    def simulation_core_count(self):
         """
-        The core logic for preparing and running the C++ subprocess.
-        Captures output in real-time and sends it to the GUI via a queue.
+        Returns how many cores the simulation is pinned to (all but core 0, which is
+        left to the GUI), or 0 when pinning isn't supported on this machine.
         """
-        exe_path = self.executable_path.get()
-        if not os.path.exists(exe_path):
-            messagebox.showerror("Error", f"Executable not found at:\n{exe_path}")
-            self.status_var.set("Error: Executable not found.")
-            self.run_button.config(state=tk.NORMAL)
-            return
+        if sys.platform != "win32":
+            return 0
+        # A process affinity mask is a single machine word
+        cpu_count = min(os.cpu_count() or 1, 8 * ctypes.sizeof(ctypes.c_void_p))
+        return cpu_count - 1 if cpu_count > 1 else 0
 
-        command = [exe_path]
+    def pin_simulation_process(self, pid, sim_cores):
+        """Restricts the simulation process to cores 1..sim_cores."""
+        PROCESS_SET_INFORMATION, PROCESS_QUERY_INFORMATION = 0x0200, 0x0400
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.OpenProcess.restype = ctypes.c_void_p
+        kernel32.SetProcessAffinityMask.argtypes = (ctypes.c_void_p, ctypes.c_size_t)
+        kernel32.CloseHandle.argtypes = (ctypes.c_void_p,)
+        handle = kernel32.OpenProcess(PROCESS_SET_INFORMATION | PROCESS_QUERY_INFORMATION, False, pid)
+        if not handle:
+            return # Pinning is only an optimization; run unpinned
         try:
-            for name, entry in self.param_entries.items():
-                command.append(f"--{name}")
-                command.append(entry.get())
-            command.append("--csv_filename"); command.append(self.output_csv_path.get())
-        except ValueError:
-            messagebox.showerror("Error", "Invalid parameter value. Please ensure all inputs are correct.")
-            self.status_var.set("Error: Invalid parameter.")
-            self.run_button.config(state=tk.NORMAL)
-            return
+            kernel32.SetProcessAffinityMask(handle, ((1 << sim_cores) - 1) << 1)
+        finally:
+            kernel32.CloseHandle(handle)
+
+    def build_command(self, exe_path, params, csv_path):
+        """Builds the simulation argv; the C++ argument parser expects "--name value" pairs."""
+        command = [exe_path]
+        for name, value in params.items():
+            command += (f"--{name}", str(value))
+        command += ("--csv_filename", csv_path)
+        return command
+
+    async def run_simulation_process(self, command, omp_threads=None):
+        """Launches one simulation process, streams its output into the console and returns its exit code."""
+        creationflags = subprocess.CREATE_NO_WINDOW
+        sim_cores = self.simulation_core_count()
+        if sim_cores:
+            # Give the simulation priority; it is pinned to the cores the GUI isn't using
+            creationflags |= subprocess.HIGH_PRIORITY_CLASS
+            omp_threads = omp_threads or sim_cores
+        env = None
+        if omp_threads:
+            # Size the OpenMP team to the cores this process gets, unless the user set it
+            env = {**os.environ, "OMP_NUM_THREADS": os.environ.get("OMP_NUM_THREADS", str(omp_threads))}
+        process = await asyncio.create_subprocess_exec(*command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT, creationflags=creationflags, env=env)
+        if sim_cores:
+            self.pin_simulation_process(process.pid, sim_cores)
 
         try:
-            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
-            
-            for line in iter(process.stdout.readline, ''):
-                self.log_queue.put(line)
+            # Read raw bytes in large blocks and log whole lines at a time,
+            # instead of decoding and inserting every line separately. Blocks are cut
+            # after a "\n", so a "\r\n" split across two reads is joined before decoding.
+            pending = bytearray()
+            while True:
+                data = await process.stdout.read(self.STDOUT_READ_SIZE)
+                if not data:
+                    break
+                pending += data
+                end = pending.rfind(b"\n") + 1
+                if end:
+                    self.log_message(self.decode_console_output(pending[:end]))
+                    del pending[:end]
+            if pending:
+                self.log_message(self.decode_console_output(pending))
+
+            return await process.wait()
+        except BaseException:
+            # Cancelled or failed while the simulation is still running: don't leave it
+            # blocked on a pipe nobody reads
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
 
-            process.stdout.close()
-            return_code = process.wait()
+    @staticmethod
+    def decode_console_output(data):
+        """Decodes a block of simulation output, translating Windows line endings for the Text widget."""
+        text = data.decode("utf-8", "replace").replace("\r\n", "\n")
+        # A bare trailing "\r" can only be the end of a final, unterminated line
+        return text[:-1] + "\n" if text.endswith("\r") else text
 
+    def sweep_thresholds(self, params):
+        """Returns the threshold values the simulation would sweep through."""
+        return list(range(params["threshold_start"], params["threshold_end"] + 1, params["threshold_interval"]))
+
+    async def run_threshold_sweep(self, exe_path, params, thresholds, csv_path):
+        """
+        Runs each threshold of the sweep as its own simulation process, several at a time.
+        Returns the per-threshold CSVs of the successful runs and the thresholds whose run failed.
+        """
+        total_cores = self.simulation_core_count() or os.cpu_count() or 1
+        workers = min(len(thresholds), total_cores)
+        omp_threads = -(-total_cores // workers) # Share the cores between the concurrent runs
+        root, ext = os.path.splitext(csv_path)
+        part_paths = {t: f"{root}_T{t}{ext or '.csv'}" for t in thresholds}
+        semaphore = asyncio.Semaphore(workers)
+
+        async def run_one(threshold):
+            part_path = part_paths[threshold]
+            run_params = {**params, "threshold_start": threshold, "threshold_end": threshold}
+            async with semaphore:
+                self.log_message(f"\n--- Starting run for Threshold = {threshold} ---\n")
+                return_code = await self.run_simulation_process(self.build_command(exe_path, run_params, part_path), omp_threads)
             if return_code != 0:
-                self.log_queue.put(f"\n--- SIMULATION FAILED (Exit Code: {return_code}) ---\n")
-                self.status_var.set(f"Error: Simulation failed (Code: {return_code}).")
+                self.log_message(f"\n--- RUN FAILED FOR THRESHOLD {threshold} (Exit Code: {return_code}) ---\n")
+                self.remove_result_files([part_path]) # Whatever a failed run wrote is incomplete
+            return part_path, return_code
+
+        tasks = [asyncio.ensure_future(run_one(t)) for t in thresholds]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # One run failed to launch (or the sweep was cancelled): stop the others too,
+            # so no simulation keeps running or starts later with these parameters
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.remove_result_files(part_paths.values()) # Nothing gets merged, so no part is kept
+            raise
+        finished = [part_path for part_path, return_code in results if return_code == 0]
+        failed = [t for t, (_, return_code) in zip(thresholds, results) if return_code != 0]
+        return finished, failed
+
+    @staticmethod
+    def remove_result_files(paths):
+        """Deletes the given result files, skipping any that were never written."""
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def merge_result_files(part_paths, csv_path):
+        """Concatenates result CSVs into csv_path, keeping only the first header, and removes the parts."""
+        with open(csv_path, "wb") as merged:
+            for part_index, part_path in enumerate(part_paths):
+                with open(part_path, "rb") as part:
+                    header = part.readline()
+                    if part_index == 0:
+                        merged.write(header)
+                    shutil.copyfileobj(part, merged)
+                os.remove(part_path)
+
+    async def run_simulation_async(self):
+        """
+        The core logic for preparing and running the C++ subprocess(es).
+        Runs on the Tk thread's event loop and streams output straight into the console.
+        """
+        # A missing executable surfaces as FileNotFoundError from the launch below
+        exe_path = self.executable_path.get()
+        params = {}
+        for name, (entry, cast) in self.param_entries.items():
+            raw_value = entry.get().strip()
+            try:
+                params[name] = cast(raw_value)
+                # The C++ sweep loops never terminate with a non-positive step
+                if name.endswith("_interval") and params[name] <= 0:
+                    raise ValueError
+            except ValueError:
+                expected = "a positive integer" if name.endswith("_interval") else "an integer" if cast is int else "a number"
+                messagebox.showerror("Error", f"Invalid value for '{name}': {raw_value!r}\nExpected {expected}.")
+                self.status_var.set(f"Error: Invalid parameter '{name}'.")
+                self.run_button.config(state=tk.NORMAL)
+                return
+        csv_path = self.output_csv_path.get()
+
+        try:
+            thresholds = self.sweep_thresholds(params)
+            status_note = ""
+            if len(thresholds) > 1:
+                # Independent thresholds run as separate processes, so one failure doesn't lose the rest
+                finished, failed = await self.run_threshold_sweep(exe_path, params, thresholds, csv_path)
+                if finished:
+                    try:
+                        self.merge_result_files(finished, csv_path)
+                    except OSError as e:
+                        messagebox.showerror("Error", f"Failed to merge the sweep results into:\n{csv_path}\n\nError: {e}\n\nThe per-threshold results were kept:\n" + "\n".join(finished))
+                        self.status_var.set("Error: Failed to merge sweep results.")
+                        return
+                succeeded = bool(finished)
+                if failed:
+                    self.log_message(f"\n--- SWEEP FINISHED: {len(failed)} OF {len(thresholds)} RUNS FAILED (Thresholds: {', '.join(map(str, failed))}) ---\n")
+                    status_note = f"Error: {len(failed)} of {len(thresholds)} sweep runs failed."
+                    self.status_var.set(status_note)
+                else:
+                    self.log_message("\n--- SIMULATION FINISHED SUCCESSFULLY ---\n")
+                    self.status_var.set("Simulation finished successfully. Loading results...")
             else:
-                self.log_queue.put("\n--- SIMULATION FINISHED SUCCESSFULLY ---\n")
-                self.status_var.set("Simulation finished successfully. Loading results...")
-                self.load_results_from_csv() 
-                self.status_var.set("Ready.")
+                return_code = await self.run_simulation_process(self.build_command(exe_path, params, csv_path))
+                succeeded = return_code == 0
+                if return_code != 0:
+                    self.log_message(f"\n--- SIMULATION FAILED (Exit Code: {return_code}) ---\n")
+                    self.status_var.set(f"Error: Simulation failed (Code: {return_code}).")
+                else:
+                    self.log_message("\n--- SIMULATION FINISHED SUCCESSFULLY ---\n")
+                    self.status_var.set("Simulation finished successfully. Loading results...")
+
+            if succeeded:
+                # Start the reload from the mainloop once this run has wound down,
+                # rather than from inside the coroutine. A partial sweep failure stays in the status.
+                self.after(0, self.load_results_from_csv, status_note)
 
         except FileNotFoundError:
-            messagebox.showerror("Error", f"Could not find the executable.\nPath: {exe_path}")
-            self.status_var.set("Error: File not found.")
+            messagebox.showerror("Error", f"Executable not found at:\n{exe_path}")
+            self.status_var.set("Error: Executable not found.")
         except Exception as e:
             error_message = f"An unexpected error occurred: {e}"
             messagebox.showerror("Runtime Error", error_message)
@@ -211,25 +564,148 @@ class SimulationLauncherApp(bs.Window):
         finally:
             self.run_button.config(state=tk.NORMAL)
 
-    def load_results_from_csv(self):
+    def load_results_from_csv(self, status_note=""):
+        """
+        Starts streaming the results CSV into the table on a background thread.
+        A status_note (e.g. a sweep failure) is kept in front of the load status.
+        """
         csv_path = self.output_csv_path.get()
-        if not os.path.exists(csv_path):
-            messagebox.showwarning("Warning", f"Could not find the results file:\n{csv_path}")
-            return
+        self._load_status_note = status_note
+        # A new load supersedes any still in progress
+        self._load_generation += 1
+        self.status_var.set(f"{status_note} Loading results from {csv_path}...".lstrip())
+        load_thread = threading.Thread(target=self.read_results_in_chunks, args=(csv_path, self._load_generation), daemon=True)
+        load_thread.start()
+        self.after(250, self.poll_results_queue, load_thread)
+
+    @staticmethod
+    def read_csv_tail(csv_path, file_size, tail_bytes):
+        """Returns the header plus the rows in the last tail_bytes of the file as an in-memory CSV."""
+        with open(csv_path, "rb") as f:
+            header = f.readline()
+            # Start one byte early so a tail beginning exactly on a row boundary keeps that row
+            f.seek(max(file_size - tail_bytes, len(header)) - 1)
+            f.readline() # Skip the partial row we landed in
+            return io.BytesIO(header + f.read())
+
+    def iter_frame_chunks(self, df):
+        """Yields views of at most CSV_CHUNK_SIZE rows over an already loaded DataFrame."""
+        for start in range(0, max(len(df), 1), self.CSV_CHUNK_SIZE):
+            yield df.iloc[start:start + self.CSV_CHUNK_SIZE]
+
+    def iter_result_chunks(self, source):
+        """Yields a results CSV (path or buffer) as DataFrames of at most CSV_CHUNK_SIZE rows."""
+        if CSV_ENGINE == "pyarrow":
+            # The pyarrow engine parses multithreaded but cannot stream, so slice the frame afterwards
+            yield from self.iter_frame_chunks(pd.read_csv(source, dtype=self.CSV_DTYPES, engine="pyarrow"))
+        else:
+            memory_map = isinstance(source, str)
+            with pd.read_csv(source, dtype=self.CSV_DTYPES, engine="c", memory_map=memory_map, chunksize=self.CSV_CHUNK_SIZE) as reader:
+                yield from reader
+
+    @staticmethod
+    def parquet_is_current(parquet_path, csv_path):
+        """True when a Parquet copy exists and is at least as new as the CSV it was made from."""
         try:
-            df = pd.read_csv(csv_path)
-            # The results table is cleared and rebuilt dynamically from the CSV columns
-            for item in self.results_tree.get_children(): self.results_tree.delete(item)
-            self.results_tree["columns"] = list(df.columns)
-            self.results_tree["show"] = "headings"
-            for col in df.columns:
-                self.results_tree.heading(col, text=col)
-                self.results_tree.column(col, anchor=tk.CENTER, width=100)
-            for index, row in df.iterrows():
-                self.results_tree.insert("", "end", values=list(row))
-            self.status_var.set(f"Successfully loaded {len(df)} rows from {csv_path}")
+            return os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)
+        except OSError:
+            return False
+
+    @staticmethod
+    def write_results_parquet(chunks, parquet_path):
+        """
+        Saves the parsed results as Parquet through a temporary file, so a failed or concurrent
+        write never leaves a partial copy behind. Failures are ignored; the CSV stays authoritative.
+        """
+        temp_path = f"{parquet_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            pd.concat(chunks, ignore_index=True).to_parquet(temp_path, compression="zstd")
+            os.replace(temp_path, parquet_path)
+        except Exception:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def read_results_in_chunks(self, csv_path, generation):
+        """
+        Loads the results on a worker thread and hands them to the GUI chunk by chunk
+        via the results queue, so rows appear while the rest is still loading.
+        Stops early once a newer load (generation) has been started.
+        """
+        try:
+            file_size = os.path.getsize(csv_path)
+            parquet_path = csv_path + ".parquet"
+            # Files past the tail threshold are always shown by their tail, so they get no Parquet copy
+            use_parquet = HAVE_PYARROW and file_size <= self.CSV_TAIL_BYTES
+            df = None
+            if use_parquet and self.parquet_is_current(parquet_path, csv_path):
+                # Skip text parsing entirely when an up-to-date Parquet copy exists
+                try:
+                    df = pd.read_parquet(parquet_path)
+                except Exception:
+                    df = None # Unreadable copy: parse the CSV and rewrite it below
+            tail_only = False
+            if df is not None:
+                chunks = self.iter_frame_chunks(df)
+            elif file_size > self.CSV_TAIL_BYTES:
+                # Past the size threshold only the most recent rows are parsed and shown
+                tail_only = True
+                chunks = self.iter_result_chunks(self.read_csv_tail(csv_path, file_size, self.CSV_TAIL_BYTES))
+            else:
+                chunks = self.iter_result_chunks(csv_path)
+
+            parsed_chunks = []
+            for chunk_index, chunk in enumerate(chunks):
+                if generation != self._load_generation:
+                    return
+                if chunk_index == 0:
+                    self.post_results_message(generation, "columns", list(chunk.columns))
+                self.post_results_message(generation, "rows", chunk)
+                parsed_chunks.append(chunk)
+            message = f"Successfully loaded {sum(map(len, parsed_chunks))} rows from {csv_path}"
+            if tail_only:
+                message += f" (showing last {self.CSV_TAIL_BYTES >> 20} MB of {file_size / (1 << 20):.0f} MB)"
+            self.post_results_message(generation, "done", message)
+
+            # Refresh the Parquet copy after the table is populated so it doesn't delay the display
+            if use_parquet and df is None and generation == self._load_generation:
+                self.write_results_parquet(parsed_chunks, parquet_path)
+        except FileNotFoundError:
+            self.post_results_message(generation, "missing", csv_path)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load or parse CSV file.\n\nError: {e}")
+            self.post_results_message(generation, "error", str(e))
+
+    def handle_results_message(self, kind, payload):
+        """Applies one results message from the loader thread to the table."""
+        if kind == "columns":
+            # The results table is cleared and rebuilt dynamically from the CSV columns
+            self._result_chunks = []
+            self._result_row_count = 0
+            self._first_visible_row = 0
+            self._row_cache.clear()
+            children = self.results_tree.get_children()
+            if children: self.results_tree.delete(*children)
+            # Reloading the same schema keeps the existing headings and column widths
+            if payload != self._cached_cols:
+                self.results_tree["columns"] = payload
+                self.results_tree["show"] = "headings"
+                for col in payload:
+                    self.results_tree.heading(col, text=col)
+                    self.results_tree.column(col, anchor=tk.CENTER, width=100)
+                self._cached_cols = payload
+        elif kind == "rows":
+            # Keep the parsed chunk as the data model; only the viewport becomes Treeview items
+            self._result_chunks.append(payload)
+            self._result_row_count += len(payload)
+            self.refresh_results_viewport()
+        elif kind == "done":
+            self.status_var.set(f"{self._load_status_note} {payload}".lstrip())
+        elif kind == "missing":
+            messagebox.showwarning("Warning", f"Could not find the results file:\n{payload}")
+            self.status_var.set(self._load_status_note or "Ready.")
+        elif kind == "error":
+            messagebox.showerror("Error", f"Failed to load or parse CSV file.\n\nError: {payload}")
             self.status_var.set("Error: Failed to load CSV.")
 
 if __name__ == "__main__":
@@ -0,0 +1,137 @@
+"""Checks for the result-file helpers of the Python launcher: CSV tails, sweep merges and the Parquet copy (no display needed)."""
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("ttkbootstrap")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ConsoleApp_controller import SimulationLauncherApp  # noqa: E402
+
+HEADER = b"Cooldown,Threshold,Run,Iteration,ClusterSize,InteractionCount\n"
+ROWS = [f"0,5,1,{i:04d},1.500,{i:04d}\n".encode() for i in range(10)]
+
+
+def read_tail(path, tail_bytes):
+    return SimulationLauncherApp.read_csv_tail(str(path), os.path.getsize(path), tail_bytes).getvalue()
+
+
+def test_tail_starting_on_row_boundary_keeps_that_row(tmp_path):
+    path = tmp_path / "results.csv"
+    path.write_bytes(HEADER + b"".join(ROWS))
+    assert read_tail(path, 3 * len(ROWS[0])) == HEADER + b"".join(ROWS[-3:])
+
+
+def test_tail_starting_mid_row_skips_partial_row(tmp_path):
+    path = tmp_path / "results.csv"
+    path.write_bytes(HEADER + b"".join(ROWS))
+    assert read_tail(path, 3 * len(ROWS[0]) - 1) == HEADER + b"".join(ROWS[-2:])
+
+
+def test_tail_larger_than_body_returns_whole_file(tmp_path):
+    path = tmp_path / "results.csv"
+    path.write_bytes(HEADER + b"".join(ROWS))
+    assert read_tail(path, 10 * os.path.getsize(path)) == HEADER + b"".join(ROWS)
+
+
+
+def test_merge_keeps_first_header_only_and_removes_parts(tmp_path):
+    parts = []
+    for part_index in range(3):
+        part = tmp_path / f"results_T{part_index}.csv"
+        part.write_bytes(HEADER + b"".join(ROWS[3 * part_index:3 * part_index + 3]))
+        parts.append(str(part))
+    merged = tmp_path / "results.csv"
+    SimulationLauncherApp.merge_result_files(parts, str(merged))
+    assert merged.read_bytes() == HEADER + b"".join(ROWS[:9])
+    assert not any(os.path.exists(part) for part in parts)
+
+
+def test_remove_result_files_skips_missing_parts(tmp_path):
+    written = tmp_path / "results_T1.csv"
+    written.write_bytes(HEADER)
+    SimulationLauncherApp.remove_result_files([str(written), str(tmp_path / "results_T2.csv")])
+    assert not written.exists()
+
+
+def load_results(path, tail_bytes=SimulationLauncherApp.CSV_TAIL_BYTES):
+    """Runs the loader thread body synchronously and returns the Iteration values it posted."""
+    app = SimulationLauncherApp.__new__(SimulationLauncherApp)
+    messages = []
+    # Set on the instance dict directly: Tk's __getattr__ would recurse on a missing attribute
+    app.__dict__.update(
+        _load_generation=1, CSV_TAIL_BYTES=tail_bytes,
+        post_results_message=lambda generation, kind, payload: messages.append((kind, payload)))
+    app.read_results_in_chunks(str(path), 1)
+    assert messages[-1][0] == "done", messages[-1]
+    return [int(i) for kind, chunk in messages if kind == "rows" for i in chunk["Iteration"]]
+
+
+def write_parquet_copy(csv_path, iterations, newer):
+    """Writes a Parquet copy whose rows differ from the CSV, dated after or before it."""
+    import pandas as pd
+    parquet_path = f"{csv_path}.parquet"
+    pd.DataFrame({"Iteration": iterations}).to_parquet(parquet_path)
+    csv_mtime = os.path.getmtime(csv_path)
+    offset = 10 if newer else -10
+    os.utime(parquet_path, (csv_mtime + offset, csv_mtime + offset))
+    return parquet_path
+
+
+@pytest.fixture
+def results_csv(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "results.csv"
+    path.write_bytes(HEADER + b"".join(ROWS))
+    return path
+
+
+def test_parquet_is_current_compares_mtimes(results_csv):
+    parquet_path = f"{results_csv}.parquet"
+    assert not SimulationLauncherApp.parquet_is_current(parquet_path, str(results_csv))
+    write_parquet_copy(results_csv, [99], newer=False)
+    assert not SimulationLauncherApp.parquet_is_current(parquet_path, str(results_csv))
+    write_parquet_copy(results_csv, [99], newer=True)
+    assert SimulationLauncherApp.parquet_is_current(parquet_path, str(results_csv))
+
+
+def test_first_load_writes_parquet_copy_and_later_loads_read_it(results_csv):
+    assert load_results(results_csv) == list(range(10))
+    assert os.path.exists(f"{results_csv}.parquet")
+    assert not [name for name in os.listdir(results_csv.parent) if name.endswith(".tmp")]
+    write_parquet_copy(results_csv, [99], newer=True)
+    assert load_results(results_csv) == [99]
+
+
+def test_stale_parquet_copy_is_ignored_and_rewritten(results_csv):
+    write_parquet_copy(results_csv, [99], newer=False)
+    assert load_results(results_csv) == list(range(10))
+    assert SimulationLauncherApp.parquet_is_current(f"{results_csv}.parquet", str(results_csv))
+
+
+def test_unreadable_parquet_copy_falls_back_to_csv_and_is_rewritten(results_csv):
+    parquet_path = write_parquet_copy(results_csv, [99], newer=True)
+    with open(parquet_path, "wb") as f:
+        f.write(b"not a parquet file")
+    assert load_results(results_csv) == list(range(10))
+    assert load_results(results_csv) == list(range(10)) # Now served from the rewritten copy
+
+
+def test_failed_parquet_write_keeps_existing_copy(results_csv):
+    parquet_path = write_parquet_copy(results_csv, [99], newer=True)
+    before = open(parquet_path, "rb").read()
+    SimulationLauncherApp.write_results_parquet([], parquet_path) # Nothing to concatenate
+    assert open(parquet_path, "rb").read() == before
+    assert not [name for name in os.listdir(results_csv.parent) if name.endswith(".tmp")]
+
+
+def test_files_past_tail_threshold_skip_parquet_copy(results_csv):
+    parquet_path = write_parquet_copy(results_csv, [99], newer=True)
+    before = open(parquet_path, "rb").read()
+    assert load_results(results_csv, tail_bytes=3 * len(ROWS[0])) == [7, 8, 9]
+    assert open(parquet_path, "rb").read() == before
+    os.remove(parquet_path)
+    load_results(results_csv, tail_bytes=3 * len(ROWS[0]))
+    assert not os.path.exists(parquet_path)